@@ -5,171 +5,157 @@ import simple_soft_float as ssf
 import unittest
 import operator
 import inspect
+import functools
 
-
-def check_signatures(test_case, cls):
-    test_case.assertIsNotNone(inspect.signature(cls))
-    for name, member in cls.__dict__.items():
-        if name.startswith("_") or not callable(member):
-            continue
-        test_case.assertIsNotNone(inspect.signature(member))
-
-
-class TestBinaryNaNPropagationMode(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.BinaryNaNPropagationMode
-        self.assertEqual(set(cls),
-                         {cls.AlwaysCanonical,
-                          cls.FirstSecond,
-                          cls.SecondFirst,
-                          cls.FirstSecondPreferringSNaN,
-                          cls.SecondFirstPreferringSNaN})
-
-
-class TestExceptionHandlingMode(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.ExceptionHandlingMode
-        self.assertEqual(set(cls),
-                         {cls.IgnoreExactUnderflow,
-                          cls.SignalExactUnderflow})
-
-
-class TestFMAInfZeroQNaNResult(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.FMAInfZeroQNaNResult
-        self.assertEqual(set(cls),
-                         {cls.FollowNaNPropagationMode,
-                          cls.CanonicalAndGenerateInvalid,
-                          cls.PropagateAndGenerateInvalid})
+_DEFAULT_FP_STATE = ssf.FPState()
+_NO_FLAGS = ssf.StatusFlags()
+_INEXACT = ssf.StatusFlags().set_inexact()
+_INVALID_OPERATION = ssf.StatusFlags().set_invalid_operation()
+_DIVISION_BY_ZERO = ssf.StatusFlags().set_division_by_zero()
+_TIES_TO_EVEN = ssf.RoundingMode.TiesToEven
 
 
-class TestFloatClass(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.FloatClass
-        self.assertEqual(set(cls),
-                         {cls.NegativeInfinity,
-                          cls.NegativeNormal,
-                          cls.NegativeSubnormal,
-                          cls.NegativeZero,
-                          cls.PositiveInfinity,
-                          cls.PositiveNormal,
-                          cls.PositiveSubnormal,
-                          cls.PositiveZero,
-                          cls.QuietNaN,
-                          cls.SignalingNaN})
-
-
-class TestFloatToFloatConversionNaNPropagationMode(unittest.TestCase):
-    maxDiff = None
+_signature = functools.lru_cache(maxsize=None)(inspect.signature)
 
-    def test_enumerants(self):
-        cls = ssf.FloatToFloatConversionNaNPropagationMode
-        self.assertEqual(set(cls),
-                         {cls.AlwaysCanonical,
-                          cls.RetainMostSignificantBits})
 
+@functools.lru_cache(maxsize=None)
+def _public_callables(cls):
+    return tuple(member for name, member in cls.__dict__.items()
+                 if not name.startswith("_") and callable(member))
 
-class TestQuietNaNFormat(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.QuietNaNFormat
-        self.assertEqual(set(cls),
-                         {cls.Standard,
-                          cls.MIPSLegacy})
-
-
-class TestRoundingMode(unittest.TestCase):
-    maxDiff = None
 
-    def test_enumerants(self):
-        cls = ssf.RoundingMode
-        self.assertEqual(set(cls),
-                         {cls.TiesToEven,
-                          cls.TowardZero,
-                          cls.TowardNegative,
-                          cls.TowardPositive,
-                          cls.TiesToAway})
-
-
-class TestSign(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.Sign
-        self.assertEqual(set(cls),
-                         {cls.Positive,
-                          cls.Negative})
-
-
-class TestTernaryNaNPropagationMode(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.TernaryNaNPropagationMode
-        self.assertEqual(set(cls),
-                         {cls.AlwaysCanonical,
-                          cls.FirstSecondThird,
-                          cls.FirstThirdSecond,
-                          cls.SecondFirstThird,
-                          cls.SecondThirdFirst,
-                          cls.ThirdFirstSecond,
-                          cls.ThirdSecondFirst,
-                          cls.FirstSecondThirdPreferringSNaN,
-                          cls.FirstThirdSecondPreferringSNaN,
-                          cls.SecondFirstThirdPreferringSNaN,
-                          cls.SecondThirdFirstPreferringSNaN,
-                          cls.ThirdFirstSecondPreferringSNaN,
-                          cls.ThirdSecondFirstPreferringSNaN})
-
-
-class TestTininessDetectionMode(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.TininessDetectionMode
-        self.assertEqual(set(cls),
-                         {cls.BeforeRounding,
-                          cls.AfterRounding})
-
-
-class TestUnaryNaNPropagationMode(unittest.TestCase):
-    maxDiff = None
-
-    def test_enumerants(self):
-        cls = ssf.UnaryNaNPropagationMode
-        self.assertEqual(set(cls),
-                         {cls.AlwaysCanonical,
-                          cls.First})
-
-
-class TestUpOrDown(unittest.TestCase):
+def check_signatures(test_case, cls):
+    test_case.assertIsNotNone(_signature(cls))
+    for member in _public_callables(cls):
+        test_case.assertIsNotNone(_signature(member))
+
+
+def check_attributes(test_case, obj, expected):
+    for name, value in expected.items():
+        with test_case.subTest(attribute=name):
+            test_case.assertEqual(getattr(obj, name), value)
+
+
+_ENUM_CASES = (
+    (ssf.BinaryNaNPropagationMode,
+     frozenset({"AlwaysCanonical",
+                "FirstSecond",
+                "SecondFirst",
+                "FirstSecondPreferringSNaN",
+                "SecondFirstPreferringSNaN"})),
+    (ssf.ExceptionHandlingMode,
+     frozenset({"IgnoreExactUnderflow",
+                "SignalExactUnderflow"})),
+    (ssf.FMAInfZeroQNaNResult,
+     frozenset({"FollowNaNPropagationMode",
+                "CanonicalAndGenerateInvalid",
+                "PropagateAndGenerateInvalid"})),
+    (ssf.FloatClass,
+     frozenset({"NegativeInfinity",
+                "NegativeNormal",
+                "NegativeSubnormal",
+                "NegativeZero",
+                "PositiveInfinity",
+                "PositiveNormal",
+                "PositiveSubnormal",
+                "PositiveZero",
+                "QuietNaN",
+                "SignalingNaN"})),
+    (ssf.FloatToFloatConversionNaNPropagationMode,
+     frozenset({"AlwaysCanonical",
+                "RetainMostSignificantBits"})),
+    (ssf.QuietNaNFormat,
+     frozenset({"Standard",
+                "MIPSLegacy"})),
+    (ssf.RoundingMode,
+     frozenset({"TiesToEven",
+                "TowardZero",
+                "TowardNegative",
+                "TowardPositive",
+                "TiesToAway"})),
+    (ssf.Sign,
+     frozenset({"Positive",
+                "Negative"})),
+    (ssf.TernaryNaNPropagationMode,
+     frozenset({"AlwaysCanonical",
+                "FirstSecondThird",
+                "FirstThirdSecond",
+                "SecondFirstThird",
+                "SecondThirdFirst",
+                "ThirdFirstSecond",
+                "ThirdSecondFirst",
+                "FirstSecondThirdPreferringSNaN",
+                "FirstThirdSecondPreferringSNaN",
+                "SecondFirstThirdPreferringSNaN",
+                "SecondThirdFirstPreferringSNaN",
+                "ThirdFirstSecondPreferringSNaN",
+                "ThirdSecondFirstPreferringSNaN"})),
+    (ssf.TininessDetectionMode,
+     frozenset({"BeforeRounding",
+                "AfterRounding"})),
+    (ssf.UnaryNaNPropagationMode,
+     frozenset({"AlwaysCanonical",
+                "First"})),
+    (ssf.UpOrDown,
+     frozenset({"Up",
+                "Down"})),
+)
+
+
+_EXPECTED_FP_STATE_REPR = (
+    "PlatformProperties(rounding_mode=RoundingMode.TiesToEven, "
+    "status_flags=StatusFlags(), "
+    "exception_handling_mode="
+    "ExceptionHandlingMode.IgnoreExactUnderflow, "
+    "tininess_detection_mode=TininessDetectionMode.AfterRounding)")
+
+_EXPECTED_FLOAT_PROPERTIES_REPR = (
+    "FloatProperties.standard(32, "
+    "PlatformProperties_RISC_V)")
+
+_EXPECTED_PLATFORM_PROPERTIES_REPR = (
+    "PlatformProperties(canonical_nan_sign=Sign.Positive, "
+    "canonical_nan_mantissa_msb=True, "
+    "canonical_nan_mantissa_second_to_msb=False, "
+    "canonical_nan_mantissa_rest=False, "
+    "std_bin_ops_nan_propagation_mode="
+    "BinaryNaNPropagationMode.AlwaysCanonical, "
+    "fma_nan_propagation_mode="
+    "TernaryNaNPropagationMode.AlwaysCanonical, "
+    "fma_inf_zero_qnan_result="
+    "FMAInfZeroQNaNResult.FollowNaNPropagationMode, "
+    "round_to_integral_nan_propagation_mode="
+    "UnaryNaNPropagationMode.AlwaysCanonical, "
+    "next_up_or_down_nan_propagation_mode="
+    "UnaryNaNPropagationMode.AlwaysCanonical, "
+    "scale_b_nan_propagation_mode="
+    "UnaryNaNPropagationMode.AlwaysCanonical, "
+    "sqrt_nan_propagation_mode="
+    "UnaryNaNPropagationMode.AlwaysCanonical, "
+    "float_to_float_conversion_nan_propagation_mode="
+    "FloatToFloatConversionNaNPropagationMode.AlwaysCanonical, "
+    "rsqrt_nan_propagation_mode="
+    "UnaryNaNPropagationMode.AlwaysCanonical)")
+
+
+class _BaseCase(unittest.TestCase):
     maxDiff = None
 
-    def test_enumerants(self):
-        cls = ssf.UpOrDown
-        self.assertEqual(set(cls),
-                         {cls.Up,
-                          cls.Down})
 
+class TestEnumerants(_BaseCase):
+    def test_all(self):
+        for cls, expected in _ENUM_CASES:
+            with self.subTest(cls=cls.__name__):
+                self.assertEqual(frozenset(cls.__members__), expected)
 
-class TestFPState(unittest.TestCase):
-    maxDiff = None
 
+class TestFPState(_BaseCase):
     def test_signatures(self):
         check_signatures(self, ssf.FPState)
 
     def test_smoke_test(self):
         rounding_mode = ssf.RoundingMode.TiesToEven
-        status_flags = ssf.StatusFlags()
+        status_flags = _NO_FLAGS
         exception_handling_mode = ssf.ExceptionHandlingMode \
             .IgnoreExactUnderflow
         tininess_detection_mode = ssf.TininessDetectionMode.AfterRounding
@@ -182,83 +168,92 @@ class TestFPState(unittest.TestCase):
         self.assertEqual(obj.status_flags, status_flags)
         self.assertEqual(obj.exception_handling_mode, exception_handling_mode)
         self.assertEqual(obj.tininess_detection_mode, tininess_detection_mode)
-        self.assertEqual(
-            repr(obj),
-            "PlatformProperties(rounding_mode=RoundingMode.TiesToEven, "
-            + "status_flags=StatusFlags(), "
-            + "exception_handling_mode="
-            + "ExceptionHandlingMode.IgnoreExactUnderflow, "
-            + "tininess_detection_mode=TininessDetectionMode.AfterRounding)")
+        self.assertEqual(repr(obj), _EXPECTED_FP_STATE_REPR)
 
 
-class TestFloatProperties(unittest.TestCase):
-    maxDiff = None
+class TestFloatProperties(_BaseCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._std32 = ssf.FloatProperties.standard(32)
 
     def test_signatures(self):
         check_signatures(self, ssf.FloatProperties)
 
-    def test_smoke_test(self):
+    def test_constructor(self):
         obj = ssf.FloatProperties(
             exponent_width=8,
             mantissa_width=23,
             has_implicit_leading_bit=True,
             has_sign_bit=True,
             platform_properties=ssf.PlatformProperties_RISC_V)
-        obj = ssf.FloatProperties.standard(32)
-        self.assertEqual(obj.is_standard, True)
-        self.assertEqual(obj.exponent_width, 8)
-        self.assertEqual(obj.mantissa_width, 23)
-        self.assertEqual(obj.has_implicit_leading_bit, True)
-        self.assertEqual(obj.has_sign_bit, True)
-        self.assertEqual(obj.platform_properties,
-                         ssf.PlatformProperties_RISC_V)
-        self.assertEqual(obj.quiet_nan_format, ssf.QuietNaNFormat.Standard)
-        self.assertEqual(obj.width, 32)
-        self.assertEqual(obj.fraction_width, 23)
-        self.assertEqual(obj.sign_field_shift, 31)
-        self.assertEqual(obj.sign_field_mask, 0x80000000)
-        self.assertEqual(obj.exponent_field_shift, 23)
-        self.assertEqual(obj.exponent_field_mask, 0x7F800000)
-        self.assertEqual(obj.mantissa_field_shift, 0)
-        self.assertEqual(obj.mantissa_field_mask, 0x007FFFFF)
-        self.assertEqual(obj.mantissa_field_max, 0x007FFFFF)
-        self.assertEqual(obj.mantissa_field_normal_min, 0x00000000)
-        self.assertEqual(obj.mantissa_field_msb_shift, 22)
-        self.assertEqual(obj.mantissa_field_msb_mask, 0x00400000)
-        self.assertEqual(obj.exponent_bias, 0x7F)
-        self.assertEqual(obj.exponent_inf_nan, 0xFF)
-        self.assertEqual(obj.exponent_zero_subnormal, 0)
-        self.assertEqual(obj.exponent_min_normal, 1)
-        self.assertEqual(obj.exponent_max_normal, 0xFE)
-        self.assertEqual(obj.overall_mask, 0xFFFFFFFF)
-        self.assertEqual(repr(obj),
-                         "FloatProperties.standard(32, "
-                         + "PlatformProperties_RISC_V)")
-
-
-class TestPlatformProperties(unittest.TestCase):
-    maxDiff = None
+        self.assertEqual(obj, self._std32)
+
+    def test_smoke_test(self):
+        check_attributes(self, self._std32, {
+            "is_standard": True,
+            "exponent_width": 8,
+            "mantissa_width": 23,
+            "has_implicit_leading_bit": True,
+            "has_sign_bit": True,
+            "platform_properties": ssf.PlatformProperties_RISC_V,
+            "quiet_nan_format": ssf.QuietNaNFormat.Standard,
+            "width": 32,
+            "fraction_width": 23,
+            "sign_field_shift": 31,
+            "sign_field_mask": 0x80000000,
+            "exponent_field_shift": 23,
+            "exponent_field_mask": 0x7F800000,
+            "mantissa_field_shift": 0,
+            "mantissa_field_mask": 0x007FFFFF,
+            "mantissa_field_max": 0x007FFFFF,
+            "mantissa_field_normal_min": 0x00000000,
+            "mantissa_field_msb_shift": 22,
+            "mantissa_field_msb_mask": 0x00400000,
+            "exponent_bias": 0x7F,
+            "exponent_inf_nan": 0xFF,
+            "exponent_zero_subnormal": 0,
+            "exponent_min_normal": 1,
+            "exponent_max_normal": 0xFE,
+            "overall_mask": 0xFFFFFFFF,
+        })
+
+    def test_repr(self):
+        self.assertEqual(repr(self._std32), _EXPECTED_FLOAT_PROPERTIES_REPR)
+
+
+class TestPlatformProperties(_BaseCase):
+    PREDEFINED = (
+        ssf.PlatformProperties_ARM,
+        ssf.PlatformProperties_RISC_V,
+        ssf.PlatformProperties_POWER,
+        ssf.PlatformProperties_MIPS_2008,
+        ssf.PlatformProperties_X86_SSE,
+        ssf.PlatformProperties_SPARC,
+        ssf.PlatformProperties_HPPA,
+        ssf.PlatformProperties_MIPS_LEGACY,
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        cls._modified_riscv = ssf.PlatformProperties(
+            ssf.PlatformProperties_RISC_V,
+            fma_inf_zero_qnan_result=ssf
+            .FMAInfZeroQNaNResult.FollowNaNPropagationMode)
 
     def test_signatures(self):
         check_signatures(self, ssf.PlatformProperties)
 
     def test_constructor_signature(self):
         cls = ssf.PlatformProperties
-        signature = inspect.signature(ssf.PlatformProperties)
-        parameters = list(signature.parameters.values())
-        parameters_set = set()
-        for i in range(len(parameters)):
-            parameter = parameters[i]
-            if i == 0:
-                self.assertEqual(parameter.name, "value")
-                self.assertEqual(parameter.kind,
-                                 inspect.Parameter.POSITIONAL_OR_KEYWORD)
-                self.assertIsNone(parameter.default)
-            else:
-                parameters_set.add(parameter.name)
-                self.assertEqual(parameter.kind,
-                                 inspect.Parameter.KEYWORD_ONLY)
-                self.assertIsNone(parameter.default)
+        signature = _signature(ssf.PlatformProperties)
+        first, *rest = signature.parameters.values()
+        self.assertEqual(first.name, "value")
+        self.assertEqual(first.kind, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        self.assertIsNone(first.default)
+        self.assertEqual({parameter.kind for parameter in rest},
+                         {inspect.Parameter.KEYWORD_ONLY})
+        self.assertEqual({parameter.default for parameter in rest}, {None})
+        parameters_set = {parameter.name for parameter in rest}
         members_set = set()
         for name, member in cls.__dict__.items():
             if name.startswith("_") or callable(member):
@@ -268,83 +263,43 @@ class TestPlatformProperties(unittest.TestCase):
         self.assertEqual(parameters_set, members_set)
 
     def test_smoke_test(self):
-        self.assertIsInstance(ssf.PlatformProperties_ARM,
-                              ssf.PlatformProperties)
-        self.assertIsInstance(ssf.PlatformProperties_RISC_V,
-                              ssf.PlatformProperties)
-        self.assertIsInstance(ssf.PlatformProperties_POWER,
-                              ssf.PlatformProperties)
-        self.assertIsInstance(ssf.PlatformProperties_MIPS_2008,
-                              ssf.PlatformProperties)
-        self.assertIsInstance(ssf.PlatformProperties_X86_SSE,
-                              ssf.PlatformProperties)
-        self.assertIsInstance(ssf.PlatformProperties_SPARC,
-                              ssf.PlatformProperties)
-        self.assertIsInstance(ssf.PlatformProperties_HPPA,
-                              ssf.PlatformProperties)
-        self.assertIsInstance(ssf.PlatformProperties_MIPS_LEGACY,
-                              ssf.PlatformProperties)
-        obj = ssf.PlatformProperties_RISC_V
-        self.assertEqual(obj.fma_inf_zero_qnan_result,
-                         ssf.FMAInfZeroQNaNResult.CanonicalAndGenerateInvalid)
-        obj = ssf.PlatformProperties(
-            obj,
-            fma_inf_zero_qnan_result=ssf
-            .FMAInfZeroQNaNResult.FollowNaNPropagationMode)
-        self.assertEqual(obj.canonical_nan_sign, ssf.Sign.Positive)
-        self.assertEqual(obj.canonical_nan_mantissa_msb, True)
-        self.assertEqual(obj.canonical_nan_mantissa_second_to_msb, False)
-        self.assertEqual(obj.canonical_nan_mantissa_rest, False)
-        self.assertEqual(obj.std_bin_ops_nan_propagation_mode,
-                         ssf.BinaryNaNPropagationMode.AlwaysCanonical)
-        self.assertEqual(obj.fma_nan_propagation_mode,
-                         ssf.TernaryNaNPropagationMode.AlwaysCanonical)
-        self.assertEqual(obj.fma_inf_zero_qnan_result,
-                         ssf.FMAInfZeroQNaNResult.FollowNaNPropagationMode)
-        self.assertEqual(obj.round_to_integral_nan_propagation_mode,
-                         ssf.UnaryNaNPropagationMode.AlwaysCanonical)
-        self.assertEqual(obj.next_up_or_down_nan_propagation_mode,
-                         ssf.UnaryNaNPropagationMode.AlwaysCanonical)
-        self.assertEqual(obj.scale_b_nan_propagation_mode,
-                         ssf.UnaryNaNPropagationMode.AlwaysCanonical)
-        self.assertEqual(obj.sqrt_nan_propagation_mode,
-                         ssf.UnaryNaNPropagationMode.AlwaysCanonical)
-        self.assertEqual(
-            obj.float_to_float_conversion_nan_propagation_mode,
-            ssf.FloatToFloatConversionNaNPropagationMode.AlwaysCanonical)
-        self.assertEqual(obj.rsqrt_nan_propagation_mode,
-                         ssf.UnaryNaNPropagationMode.AlwaysCanonical)
-        self.assertEqual(obj.quiet_nan_format,
-                         ssf.QuietNaNFormat.Standard)
+        unary_mode = ssf.UnaryNaNPropagationMode
+        binary_mode = ssf.BinaryNaNPropagationMode
+        ternary_mode = ssf.TernaryNaNPropagationMode
+        float_to_float_mode = ssf.FloatToFloatConversionNaNPropagationMode
+        fma_result = ssf.FMAInfZeroQNaNResult
+        for obj in self.PREDEFINED:
+            with self.subTest(obj=obj):
+                self.assertIsInstance(obj, ssf.PlatformProperties)
         self.assertEqual(
-            repr(obj),
-            "PlatformProperties(canonical_nan_sign=Sign.Positive, "
-            + "canonical_nan_mantissa_msb=True, "
-            + "canonical_nan_mantissa_second_to_msb=False, "
-            + "canonical_nan_mantissa_rest=False, "
-            + "std_bin_ops_nan_propagation_mode="
-            + "BinaryNaNPropagationMode.AlwaysCanonical, "
-            + "fma_nan_propagation_mode="
-            + "TernaryNaNPropagationMode.AlwaysCanonical, "
-            + "fma_inf_zero_qnan_result="
-            + "FMAInfZeroQNaNResult.FollowNaNPropagationMode, "
-            + "round_to_integral_nan_propagation_mode="
-            + "UnaryNaNPropagationMode.AlwaysCanonical, "
-            + "next_up_or_down_nan_propagation_mode="
-            + "UnaryNaNPropagationMode.AlwaysCanonical, "
-            + "scale_b_nan_propagation_mode="
-            + "UnaryNaNPropagationMode.AlwaysCanonical, "
-            + "sqrt_nan_propagation_mode="
-            + "UnaryNaNPropagationMode.AlwaysCanonical, "
-            + "float_to_float_conversion_nan_propagation_mode="
-            + "FloatToFloatConversionNaNPropagationMode.AlwaysCanonical, "
-            + "rsqrt_nan_propagation_mode="
-            + "UnaryNaNPropagationMode.AlwaysCanonical)")
-
-
-class TestStatusFlags(unittest.TestCase):
-    maxDiff = None
-
+            ssf.PlatformProperties_RISC_V.fma_inf_zero_qnan_result,
+            fma_result.CanonicalAndGenerateInvalid)
+        check_attributes(self, self._modified_riscv, {
+            "canonical_nan_sign": ssf.Sign.Positive,
+            "canonical_nan_mantissa_msb": True,
+            "canonical_nan_mantissa_second_to_msb": False,
+            "canonical_nan_mantissa_rest": False,
+            "std_bin_ops_nan_propagation_mode": binary_mode.AlwaysCanonical,
+            "fma_nan_propagation_mode": ternary_mode.AlwaysCanonical,
+            "fma_inf_zero_qnan_result": fma_result.FollowNaNPropagationMode,
+            "round_to_integral_nan_propagation_mode":
+                unary_mode.AlwaysCanonical,
+            "next_up_or_down_nan_propagation_mode":
+                unary_mode.AlwaysCanonical,
+            "scale_b_nan_propagation_mode": unary_mode.AlwaysCanonical,
+            "sqrt_nan_propagation_mode": unary_mode.AlwaysCanonical,
+            "float_to_float_conversion_nan_propagation_mode":
+                float_to_float_mode.AlwaysCanonical,
+            "rsqrt_nan_propagation_mode": unary_mode.AlwaysCanonical,
+            "quiet_nan_format": ssf.QuietNaNFormat.Standard,
+        })
+
+    def test_repr(self):
+        self.assertEqual(repr(self._modified_riscv),
+                         _EXPECTED_PLATFORM_PROPERTIES_REPR)
+
+
+class TestStatusFlags(_BaseCase):
     def test_smoke_test(self):
         self.assertIsInstance(ssf.StatusFlags().set_invalid_operation(),
                               ssf.StatusFlags)
@@ -368,43 +323,53 @@ class TestStatusFlags(unittest.TestCase):
             ssf.StatusFlags.all())
         self.assertEqual(repr(ssf.StatusFlags()),
                          "StatusFlags()")
-        self.assertEqual(repr(ssf.StatusFlags.all()),
-                         "StatusFlags().set_invalid_operation()"
-                         + ".set_division_by_zero()"
-                         + ".set_overflow()"
-                         + ".set_underflow()"
-                         + ".set_inexact()")
-
-
-class TestDynamicFloat(unittest.TestCase):
-    maxDiff = None
-    properties = ssf.FloatProperties.standard(32,
-                                              platform_properties=ssf.PlatformProperties_RISC_V)
+        self.assertEqual(
+            repr(ssf.StatusFlags().set_invalid_operation().set_inexact()),
+            "StatusFlags().set_invalid_operation().set_inexact()")
+
+
+class TestDynamicFloat(_BaseCase):
+    _BINARY_OPS = (
+        ("add", operator.add, 0x00000000, _NO_FLAGS),
+        ("sub", operator.sub, 0x00000000, _NO_FLAGS),
+        ("mul", operator.mul, 0x00000000, _NO_FLAGS),
+        ("div", operator.truediv,
+         0x7FC00000, _INVALID_OPERATION),
+        ("ieee754_remainder", None,
+         0x7FC00000, _INVALID_OPERATION),
+    )
+
+    @classmethod
+    def setUpClass(cls):
+        cls.properties = ssf.FloatProperties.standard(
+            32, platform_properties=ssf.PlatformProperties_RISC_V)
+        cls._pos_zero = ssf.DynamicFloat.positive_zero(cls.properties)
+        cls._pos_inf = ssf.DynamicFloat.positive_infinity(cls.properties)
+        cls._qnan = ssf.DynamicFloat.quiet_nan(cls.properties)
 
     def test_signatures(self):
         check_signatures(self, ssf.DynamicFloat)
 
     def test_construct(self):
-        obj = ssf.DynamicFloat(properties=self.properties)
-        self.assertEqual(obj.properties, self.properties)
-        self.assertEqual(obj.bits, 0)
-        self.assertEqual(obj.fp_state, ssf.FPState())
-        obj = ssf.DynamicFloat(obj, bits=0x1)
-        self.assertEqual(obj.properties, self.properties)
-        self.assertEqual(obj.bits, 0x1)
-        self.assertEqual(obj.fp_state, ssf.FPState())
-        obj = ssf.DynamicFloat(properties=self.properties, bits=0x2)
-        self.assertEqual(obj.properties, self.properties)
-        self.assertEqual(obj.bits, 0x2)
-        self.assertEqual(obj.fp_state, ssf.FPState())
-        obj = ssf.DynamicFloat(
-            properties=self.properties,
-            bits=0x3,
-            fp_state=ssf.FPState(status_flags=ssf.StatusFlags().set_inexact()))
-        self.assertEqual(obj.properties, self.properties)
-        self.assertEqual(obj.bits, 0x3)
-        self.assertEqual(obj.fp_state,
-                         ssf.FPState(status_flags=ssf.StatusFlags().set_inexact()))
+        default = ssf.DynamicFloat(properties=self.properties)
+        inexact_state = ssf.FPState(status_flags=_INEXACT)
+        cases = (
+            (default, 0, _DEFAULT_FP_STATE),
+            (ssf.DynamicFloat(default, bits=0x1), 0x1, _DEFAULT_FP_STATE),
+            (ssf.DynamicFloat(properties=self.properties, bits=0x2),
+             0x2, _DEFAULT_FP_STATE),
+            (ssf.DynamicFloat(properties=self.properties,
+                              bits=0x3,
+                              fp_state=inexact_state),
+             0x3, inexact_state),
+        )
+        for obj, bits, fp_state in cases:
+            with self.subTest(bits=bits):
+                check_attributes(self, obj, {
+                    "properties": self.properties,
+                    "bits": bits,
+                    "fp_state": fp_state,
+                })
 
     def test_constants(self):
         cls = ssf.DynamicFloat
@@ -440,195 +405,147 @@ class TestDynamicFloat(unittest.TestCase):
         self.assertEqual(obj.bits, 0x80000001)
         self.assertIsNone(getattr(cls, "from_real_algebraic_number", None))
 
-    def handle_binary_op(self, op_name, python_op, bits, status_flags):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = getattr(arg, op_name)(arg, rounding_mode)
-        self.assertEqual(obj.bits, bits)
-        self.assertEqual(obj.fp_state.status_flags, status_flags)
-        if python_op is not None:
-            obj = python_op(arg, arg)
-            self.assertEqual(obj.bits, bits)
-            self.assertEqual(obj.fp_state.status_flags, status_flags)
-
-    def test_add(self):
-        self.handle_binary_op("add", operator.add,
-                              0x00000000, ssf.StatusFlags())
-
-    def test_sub(self):
-        self.handle_binary_op("sub", operator.sub,
-                              0x00000000, ssf.StatusFlags())
-
-    def test_mul(self):
-        self.handle_binary_op("mul", operator.mul,
-                              0x00000000, ssf.StatusFlags())
-
-    def test_div(self):
-        self.handle_binary_op("div", operator.truediv,
-                              0x7FC00000, ssf.StatusFlags().set_invalid_operation())
-
-    def test_ieee754_remainder(self):
-        self.handle_binary_op("ieee754_remainder", None,
-                              0x7FC00000, ssf.StatusFlags().set_invalid_operation())
+    def test_binary_ops(self):
+        arg = self._pos_zero
+        for op_name, python_op, bits, status_flags in self._BINARY_OPS:
+            with self.subTest(op=op_name):
+                obj = getattr(arg, op_name)(arg, _TIES_TO_EVEN)
+                self.assertEqual(obj.bits, bits)
+                self.assertEqual(obj.fp_state.status_flags, status_flags)
+                if python_op is not None:
+                    obj = python_op(arg, arg)
+                    self.assertEqual(obj.bits, bits)
+                    self.assertEqual(obj.fp_state.status_flags, status_flags)
 
     def test_fused_mul_add(self):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = arg.fused_mul_add(arg, arg, rounding_mode)
+        arg = self._pos_zero
+        obj = arg.fused_mul_add(arg, arg, _TIES_TO_EVEN)
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_round_to_integer(self):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = arg.round_to_integer(exact=True, rounding_mode=rounding_mode)
+        arg = self._pos_zero
+        obj = arg.round_to_integer(exact=True, rounding_mode=_TIES_TO_EVEN)
         self.assertEqual(obj[0], 0)
-        self.assertEqual(obj[1], ssf.FPState())
+        self.assertEqual(obj[1], _DEFAULT_FP_STATE)
 
     def test_round_to_integral(self):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = arg.round_to_integral(exact=True, rounding_mode=rounding_mode)
+        arg = self._pos_zero
+        obj = arg.round_to_integral(exact=True, rounding_mode=_TIES_TO_EVEN)
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_next_up_or_down(self):
-        cls = ssf.DynamicFloat
-        arg = cls.positive_zero(self.properties)
+        arg = self._pos_zero
         obj = arg.next_up_or_down(ssf.UpOrDown.Up)
         self.assertEqual(obj.bits, 0x00000001)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
         obj = arg.next_up_or_down(ssf.UpOrDown.Down)
         self.assertEqual(obj.bits, 0x80000001)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
         obj = arg.next_up()
         self.assertEqual(obj.bits, 0x00000001)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
         obj = arg.next_down()
         self.assertEqual(obj.bits, 0x80000001)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_log_b(self):
-        cls = ssf.DynamicFloat
-        arg = cls.positive_zero(self.properties)
+        arg = self._pos_zero
         obj = arg.log_b()
         self.assertEqual(obj[0], None)
-        self.assertEqual(
-            obj[1],
-            ssf.FPState(status_flags=ssf.StatusFlags().set_invalid_operation()))
+        self.assertEqual(obj[1], ssf.FPState(status_flags=_INVALID_OPERATION))
 
     def test_scale_b(self):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = arg.scale_b(5, rounding_mode)
+        arg = self._pos_zero
+        obj = arg.scale_b(5, _TIES_TO_EVEN)
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_sqrt(self):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = arg.sqrt(rounding_mode)
+        arg = self._pos_zero
+        obj = arg.sqrt(_TIES_TO_EVEN)
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_convert_to_dynamic_float(self):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = arg.convert_to_dynamic_float(rounding_mode, self.properties)
+        arg = self._pos_zero
+        obj = arg.convert_to_dynamic_float(_TIES_TO_EVEN, self.properties)
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_abs(self):
-        cls = ssf.DynamicFloat
-        arg = cls.positive_zero(self.properties)
+        arg = self._pos_zero
         obj = arg.abs()
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
         obj = abs(arg)
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_neg(self):
-        cls = ssf.DynamicFloat
-        arg = cls.positive_zero(self.properties)
+        arg = self._pos_zero
         obj = arg.neg()
         self.assertEqual(obj.bits, 0x80000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
         obj = -arg
         self.assertEqual(obj.bits, 0x80000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_copy_sign(self):
-        cls = ssf.DynamicFloat
-        arg = cls.positive_zero(self.properties)
+        arg = self._pos_zero
         obj = arg.copy_sign(arg)
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_compare(self):
-        cls = ssf.DynamicFloat
-        zero = cls.positive_zero(self.properties)
-        inf = cls.positive_infinity(self.properties)
-        nan = cls.quiet_nan(self.properties)
+        zero = self._pos_zero
+        inf = self._pos_inf
+        nan = self._qnan
         obj = zero.compare_quiet(zero)
         self.assertEqual(obj[0], 0)
-        self.assertEqual(obj[1], ssf.FPState())
+        self.assertEqual(obj[1], _DEFAULT_FP_STATE)
         obj = zero.compare_quiet(inf)
         self.assertEqual(obj[0], -1)
-        self.assertEqual(obj[1], ssf.FPState())
+        self.assertEqual(obj[1], _DEFAULT_FP_STATE)
         obj = inf.compare_quiet(zero)
         self.assertEqual(obj[0], 1)
-        self.assertEqual(obj[1], ssf.FPState())
+        self.assertEqual(obj[1], _DEFAULT_FP_STATE)
         obj = nan.compare_quiet(nan)
         self.assertIsNone(obj[0])
-        self.assertEqual(obj[1], ssf.FPState())
+        self.assertEqual(obj[1], _DEFAULT_FP_STATE)
         obj = nan.compare_signaling(nan)
         self.assertIsNone(obj[0])
-        self.assertEqual(
-            obj[1],
-            ssf.FPState(status_flags=ssf.StatusFlags().set_invalid_operation()))
+        self.assertEqual(obj[1], ssf.FPState(status_flags=_INVALID_OPERATION))
         obj = zero.compare(zero, quiet=False)
         self.assertEqual(obj[0], 0)
-        self.assertEqual(obj[1], ssf.FPState())
+        self.assertEqual(obj[1], _DEFAULT_FP_STATE)
 
     def test_from_int(self):
         cls = ssf.DynamicFloat
         obj = cls.from_int(0, self.properties)
         self.assertEqual(obj.bits, 0x00000000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
         obj = cls.from_int(1, self.properties,
-                           rounding_mode=ssf.RoundingMode.TiesToEven,
-                           fp_state=ssf.FPState())
+                           rounding_mode=_TIES_TO_EVEN,
+                           fp_state=_DEFAULT_FP_STATE)
         self.assertEqual(obj.bits, 0x3F800000)
-        self.assertEqual(obj.fp_state.status_flags, ssf.StatusFlags())
+        self.assertEqual(obj.fp_state.status_flags, _NO_FLAGS)
 
     def test_to_int(self):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = arg.to_int(exact=False, rounding_mode=rounding_mode)
+        arg = self._pos_zero
+        obj = arg.to_int(exact=False, rounding_mode=_TIES_TO_EVEN)
         self.assertEqual(obj[0], 0)
-        self.assertEqual(obj[1], ssf.FPState())
+        self.assertEqual(obj[1], _DEFAULT_FP_STATE)
 
     def test_rsqrt(self):
-        cls = ssf.DynamicFloat
-        rounding_mode = ssf.RoundingMode.TiesToEven
-        arg = cls.positive_zero(self.properties)
-        obj = arg.rsqrt(rounding_mode)
+        arg = self._pos_zero
+        obj = arg.rsqrt(_TIES_TO_EVEN)
         self.assertEqual(obj.bits, 0x7F800000)
-        self.assertEqual(obj.fp_state.status_flags,
-                         ssf.StatusFlags().set_division_by_zero())
+        self.assertEqual(obj.fp_state.status_flags, _DIVISION_BY_ZERO)
 
     def test_attributes(self):
-        cls = ssf.DynamicFloat
-        obj = cls.positive_zero(self.properties)
+        obj = self._pos_zero
         self.assertEqual(obj.bits, 0x00000000)
         self.assertIsInstance(obj.fp_state, ssf.FPState)
         self.assertIsInstance(obj.properties, ssf.FloatProperties)